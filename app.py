@@ -1,3 +1,5 @@
+import io
+
 import streamlit as st
 import numpy as np
 import matplotlib.pyplot as plt
@@ -10,30 +12,63 @@ st.set_page_config(page_title="MOSFET Power & Thermal Analyzer", layout="wide")
 st.title("⚡ MOSFET Power & Thermal Analyzer")
 
 # =========================
-# Sidebar Inputs
+# Cached Computations
 # =========================
 
-st.sidebar.header("Electrical Parameters")
+# Streamlit reruns the whole script on every widget change; these are keyed on
+# their inputs so unrelated interactions reuse the previous results.
 
-Vds = st.sidebar.number_input("Vds (V)", value=400.0)
-Id = st.sidebar.number_input("Drain Current Id (A)", value=10.0)
-Rds = st.sidebar.number_input("Rds(on) (Ω)", value=0.05)
+@st.cache_data
+def compute_losses(Vds, Id, Rds, tr, tf, fsw):
+    Pcond = conduction_loss(Id, Rds)
+    Psw = switching_loss(Vds, Id, tr, tf, fsw)
+    return Pcond, Psw, total_loss(Pcond, Psw)
 
-st.sidebar.header("Switching Parameters")
 
-tr = st.sidebar.number_input("Rise Time (ns)", value=50.0) * 1e-9
-tf = st.sidebar.number_input("Fall Time (ns)", value=50.0) * 1e-9
-fsw = st.sidebar.number_input("Switching Frequency (Hz)", value=50000.0)
+@st.cache_data
+def compute_sweep(Vds, Id, Rds, tr, tf, fsw, Ta, Rth_total):
+    I_sweep = np.linspace(max(0.1, Id * 0.05), Id * 2, 100, dtype=np.float32)
+    Pcond_sweep = conduction_loss(I_sweep, Rds)
+    Psw_sweep = switching_loss(Vds, I_sweep, tr, tf, fsw)
+    Ptotal_sweep = total_loss(Pcond_sweep, Psw_sweep)
+    return I_sweep, junction_temp_simple(Ta, Ptotal_sweep, Rth_total)
 
-st.sidebar.header("Output Parameters")
 
-Vout = st.sidebar.number_input("Output Voltage (V)", value=48.0)
-Iout = st.sidebar.number_input("Output Current (A)", value=10.0)
+def _fig_to_png(fig):
+    # Same resolution and trimming as st.pyplot, then release the figure
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
 
-st.sidebar.header("Thermal Model")
 
-Ta = st.sidebar.number_input("Ambient Temperature (°C)", value=25.0)
-Tj_max = st.sidebar.number_input("Maximum Junction Temp (°C)", value=150.0)
+@st.cache_data(max_entries=64)
+def render_breakdown_png(Pcond, Psw):
+    # Callers pass values rounded to 0.01 W so near-identical inputs share one rendered image
+    fig, ax = plt.subplots()
+    ax.bar(["Conduction", "Switching"], [Pcond, Psw])
+    ax.set_ylabel("Power Loss (W)")
+    ax.set_title("Power Loss Breakdown")
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def render_tj_sweep_png(I_sweep, Tj_sweep, Tj_max):
+    fig, ax = plt.subplots()
+    ax.plot(I_sweep, Tj_sweep)
+    ax.axhline(Tj_max)
+    ax.set_xlabel("Drain Current (A)")
+    ax.set_ylabel("Junction Temperature (°C)")
+    ax.set_title("Junction Temperature vs Current")
+    return _fig_to_png(fig)
+
+# =========================
+# Sidebar Inputs
+# =========================
+
+# The model selector sits outside the form so the matching Rθ inputs appear
+# immediately; everything else is applied together on "Recalculate".
+st.sidebar.header("Thermal Model")
 
 thermal_mode = st.sidebar.radio(
     "Thermal Model Type",
@@ -41,22 +76,46 @@ thermal_mode = st.sidebar.radio(
     index=1
 )
 
-if thermal_mode == "Simple (RθJA)":
-    Rth_ja = st.sidebar.number_input("RθJA (°C/W)", value=4.0)
-else:
-    Rth_jc = st.sidebar.number_input("RθJC (°C/W)", value=1.5)
-    Rth_cs = st.sidebar.number_input("RθCS (°C/W)", value=0.5)
-    Rth_sa = st.sidebar.number_input("RθSA (°C/W)", value=3.0)
+with st.sidebar.form("inputs"):
+
+    st.header("Electrical Parameters")
 
-enable_sweeps = st.sidebar.checkbox("Enable Parameter Sweeps", value=True)
+    Vds = st.number_input("Vds (V)", value=400.0)
+    Id = st.number_input("Drain Current Id (A)", value=10.0)
+    Rds = st.number_input("Rds(on) (Ω)", value=0.05)
+
+    st.header("Switching Parameters")
+
+    tr = st.number_input("Rise Time (ns)", value=50.0) * 1e-9
+    tf = st.number_input("Fall Time (ns)", value=50.0) * 1e-9
+    fsw = st.number_input("Switching Frequency (Hz)", value=50000.0)
+
+    st.header("Output Parameters")
+
+    Vout = st.number_input("Output Voltage (V)", value=48.0)
+    Iout = st.number_input("Output Current (A)", value=10.0)
+
+    st.header("Thermal Parameters")
+
+    Ta = st.number_input("Ambient Temperature (°C)", value=25.0)
+    Tj_max = st.number_input("Maximum Junction Temp (°C)", value=150.0)
+
+    if thermal_mode == "Simple (RθJA)":
+        Rth_ja = st.number_input("RθJA (°C/W)", value=4.0)
+    else:
+        Rth_jc = st.number_input("RθJC (°C/W)", value=1.5)
+        Rth_cs = st.number_input("RθCS (°C/W)", value=0.5)
+        Rth_sa = st.number_input("RθSA (°C/W)", value=3.0)
+
+    enable_sweeps = st.checkbox("Enable Parameter Sweeps", value=True)
+
+    st.form_submit_button("Recalculate")
 
 # =========================
 # Core Calculations
 # =========================
 
-Pcond = conduction_loss(Id, Rds)
-Psw = switching_loss(Vds, Id, tr, tf, fsw)
-Ptotal = total_loss(Pcond, Psw)
+Pcond, Psw, Ptotal = compute_losses(Vds, Id, Rds, tr, tf, fsw)
 
 if thermal_mode == "Simple (RθJA)":
     Tj = junction_temp_simple(Ta, Ptotal, Rth_ja)
@@ -121,11 +180,7 @@ else:
 # Power Breakdown Plot
 # =========================
 
-fig1, ax1 = plt.subplots()
-ax1.bar(["Conduction", "Switching"], [Pcond, Psw])
-ax1.set_ylabel("Power Loss (W)")
-ax1.set_title("Power Loss Breakdown")
-st.pyplot(fig1)
+st.image(render_breakdown_png(round(Pcond, 2), round(Psw, 2)), width="stretch")
 
 # =========================
 # Parameter Sweeps
@@ -133,32 +188,13 @@ st.pyplot(fig1)
 
 if enable_sweeps:
 
-    I_sweep = np.linspace(max(0.1, Id * 0.05), Id * 2, 100)
-
     # Junction Temp vs Current
     st.subheader("Junction Temperature vs Drain Current")
 
-    Tj_sweep = []
-
-    for I in I_sweep:
-        Pcond_s = conduction_loss(I, Rds)
-        Psw_s = switching_loss(Vds, I, tr, tf, fsw)
-        Ptotal_s = total_loss(Pcond_s, Psw_s)
-
-        if thermal_mode == "Simple (RθJA)":
-            Tj_s = junction_temp_simple(Ta, Ptotal_s, Rth_ja)
-        else:
-            Tj_s = junction_temp_detailed(Ta, Ptotal_s, Rth_jc, Rth_cs, Rth_sa)
-
-        Tj_sweep.append(Tj_s)
+    # Thermal model is resolved once above; Rth_total_current covers both modes
+    I_sweep, Tj_sweep = compute_sweep(Vds, Id, Rds, tr, tf, fsw, Ta, Rth_total_current)
 
-    fig2, ax2 = plt.subplots()
-    ax2.plot(I_sweep, Tj_sweep)
-    ax2.axhline(Tj_max)
-    ax2.set_xlabel("Drain Current (A)")
-    ax2.set_ylabel("Junction Temperature (°C)")
-    ax2.set_title("Junction Temperature vs Current")
-    st.pyplot(fig2)
+    st.image(render_tj_sweep_png(I_sweep, Tj_sweep, Tj_max), width="stretch")
 
 # =========================
 # Safety Margin
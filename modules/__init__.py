@@ -0,0 +1,6 @@
+"""Power and thermal calculations.
+
+Every function in ``mosfet`` and ``thermal`` takes scalars or NumPy arrays.
+Array arguments broadcast elementwise against each other and against scalars,
+so a whole parameter sweep can be evaluated in a single call.
+"""
@@ -0,0 +1,10 @@
+# Optional dependencies shared by the calculation modules.
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(func=None, **kwargs):
+        # Supports both bare @njit and @njit(...) usage
+        if func is None:
+            return lambda f: f
+        return func
@@ -1,10 +1,15 @@
 import numpy as np
 
+from ._compat import njit
+
+@njit(cache=True, fastmath=True)
 def conduction_loss(I_rms, Rds_on):
     return I_rms**2 * Rds_on
 
+@njit(cache=True, fastmath=True)
 def switching_loss(Vds, Id, tr, tf, f_sw):
     return 0.5 * Vds * Id * (tr + tf) * f_sw
 
+@njit(cache=True, fastmath=True)
 def total_loss(P_cond, P_sw):
     return P_cond + P_sw
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from modules.mosfet import conduction_loss, switching_loss, total_loss
+from modules import mosfet, thermal
+from modules.thermal import junction_temp_simple, junction_temp_detailed, safety_margin
+
+I = np.linspace(0.5, 20.0, 7)
+RDS = np.array([0.01, 0.05, 0.1])
+
+
+def test_loss_functions_broadcast_2d_against_1d_and_scalars():
+    P_cond = conduction_loss(I[:, None], RDS[None, :])
+    P_sw = switching_loss(400.0, I[:, None], 50e-9, 50e-9, 50e3)
+    P_total = total_loss(P_cond, P_sw)
+    assert P_cond.shape == P_total.shape == (len(I), len(RDS))
+    assert P_sw.shape == (len(I), 1)
+
+    for i, current in enumerate(I):
+        for j, rds in enumerate(RDS):
+            p_cond = conduction_loss(float(current), float(rds))
+            p_sw = switching_loss(400.0, float(current), 50e-9, 50e-9, 50e3)
+            assert np.isclose(P_cond[i, j], p_cond)
+            assert np.isclose(P_sw[i, 0], p_sw)
+            assert np.isclose(P_total[i, j], total_loss(p_cond, p_sw))
+
+
+def test_thermal_functions_broadcast_and_match_scalar():
+    P = total_loss(conduction_loss(I, 0.05), switching_loss(400.0, I, 50e-9, 50e-9, 50e3))
+    Tj = junction_temp_detailed(25.0, P, 1.5, 0.5, 3.0)
+    margin = safety_margin(Tj, 150.0)
+    assert Tj.shape == margin.shape == I.shape
+
+    for k, p in enumerate(P):
+        assert np.isclose(Tj[k], junction_temp_detailed(25.0, float(p), 1.5, 0.5, 3.0))
+        assert np.isclose(margin[k], safety_margin(float(Tj[k]), 150.0))
+
+
+def test_detailed_stack_equals_simple_with_summed_resistance():
+    # compute_sweep in app.py evaluates both thermal models through junction_temp_simple
+    P = np.linspace(0.0, 50.0, 11)
+    np.testing.assert_allclose(
+        junction_temp_detailed(25.0, P, 1.5, 0.5, 3.0),
+        junction_temp_simple(25.0, P, 1.5 + 0.5 + 3.0),
+    )
+
+
+def test_numba_compiled_functions_match_python():
+    numba = pytest.importorskip("numba")
+    funcs = [
+        (mosfet.conduction_loss, (I, 0.05)),
+        (mosfet.switching_loss, (400.0, I, 50e-9, 50e-9, 50e3)),
+        (mosfet.total_loss, (I, I[::-1])),
+        (thermal.junction_temp_simple, (25.0, I, 4.0)),
+        (thermal.junction_temp_detailed, (25.0, I, 1.5, 0.5, 3.0)),
+        (thermal.safety_margin, (I, 150.0)),
+    ]
+    for func, args in funcs:
+        assert isinstance(func, numba.core.registry.CPUDispatcher)
+        np.testing.assert_allclose(func(*args), func.py_func(*args))
+        scalar_args = tuple(float(a[0]) if isinstance(a, np.ndarray) else a for a in args)
+        assert np.isclose(func(*scalar_args), func.py_func(*scalar_args))
@@ -0,0 +1,86 @@
+import builtins
+import warnings
+
+import numpy as np
+
+import wire_gauge_selector as wgs
+
+
+def _run_main(monkeypatch, capsys, answers):
+    answers = iter(answers)
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    wgs.main()
+    return capsys.readouterr().out
+
+
+def test_voltage_drop_matches_resistance_tables_exactly():
+    for material, res_table in (("copper", wgs.resistance_cu), ("aluminum", wgs.resistance_al)):
+        for awg, r in res_table.items():
+            vd_volts = 2 * 10 * 50 * r / 1000
+            assert wgs.voltage_drop(10, 50, awg, 120, material) == (vd_volts, vd_volts / 120 * 100)
+
+
+def test_drop_exactly_at_limit_is_accepted(monkeypatch, capsys):
+    # 10 A over 50 ft of 14 AWG copper at 100 V drops exactly 2.525%
+    out = _run_main(monkeypatch, capsys, ["copper", "10", "100", "50", "1", "n", "2.525"])
+    assert "Calculated voltage drop: 2.52 V  (2.52%)" in out
+    assert "Exceeds" not in out
+    assert "Final recommendation: 14 AWG" in out
+
+
+def test_find_min_gauge_batch_matches_scalar_and_keeps_shape():
+    required = np.array([[0, 20, 67.5], [135, 230, 500]])
+    for material in ("copper", "aluminum"):
+        for temp_idx in range(3):
+            awgs, allowed = wgs.find_min_gauge_batch(required, temp_idx, material)
+            assert awgs.shape == allowed.shape == required.shape
+            for pos, req in np.ndenumerate(required):
+                awg, amps = wgs.find_min_gauge(req, temp_idx, material)
+                assert awgs[pos] == awg
+                if amps is None:
+                    assert np.isnan(allowed[pos])
+                else:
+                    assert allowed[pos] == amps
+
+
+def test_voltage_drop_returns_python_floats():
+    vd_volts, vd_percent = wgs.voltage_drop(10, 50, 14, 120, "copper")
+    assert type(vd_volts) is float and type(vd_percent) is float
+    assert wgs.voltage_drop(10, 50, 14, 120, "aluminum") == (None, None)
+
+
+def test_voltage_drop_all_broadcasts_current_and_length():
+    current = np.array([10.0, 20.0, 40.0])
+    length_ft = np.array([50.0, 100.0, 25.0])
+    vd_volts, vd_percent = wgs.voltage_drop_all(current, length_ft, 120, "copper", start_idx=2)
+    options = wgs.get_gauge_options("copper")[2:]
+    assert vd_volts.shape == vd_percent.shape == (3, len(options))
+    for i in range(3):
+        for j, awg in enumerate(options):
+            expected = wgs.voltage_drop(current[i], length_ft[i], awg, 120, "copper")
+            assert np.isclose(vd_volts[i, j], expected[0])
+            assert np.isclose(vd_percent[i, j], expected[1])
+
+
+def test_voltage_drop_all_zero_voltage_gives_zero_percent():
+    vd_volts, vd_percent = wgs.voltage_drop_all(10, 50, 0, "aluminum")
+    assert np.all(vd_volts > 0)
+    assert vd_percent.shape == vd_volts.shape
+    assert not vd_percent.any()
+
+
+def test_gauge_options_are_immutable_and_ordered():
+    options = wgs.get_gauge_options("copper")
+    assert isinstance(options, tuple)
+    assert options == (14, 12, 10, 8, 6, 4, 3, 2, 1, '1/0', '2/0', '3/0', '4/0')
+    assert wgs.get_gauge_options("aluminum")[0] == 12
+
+
+def test_nan_drop_stops_upsizing_without_warnings(monkeypatch, capsys):
+    # 0 A over an infinite run gives a NaN drop; the original loop never upsized on NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        out = _run_main(monkeypatch, capsys, ["copper", "0", "120", "inf", "1", "n", "3"])
+    assert "Calculated voltage drop: nan V  (nan%)" in out
+    assert "Exceeds" not in out
+    assert "Even the largest wire exceeds voltage drop limit" in out
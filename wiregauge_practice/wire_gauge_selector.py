@@ -2,6 +2,10 @@
 # Wire Gauge Selector (Copper or Aluminum, Single-Phase, Basic NEC-based)
 # Features: continuous load factor (125%), aluminum support, short-run warning, drop current clarification
 
+from functools import lru_cache
+
+import numpy as np
+
 # Ampacity for Copper - NEC Table 310.15(B)(16) @ 30°C ambient, ≤3 CCC
 # Format: AWG: (60°C, 75°C, 90°C)
 ampacity_cu = {
@@ -74,28 +78,82 @@ def get_ampacity_table(material):
 def get_resistance_table(material):
     return resistance_cu if material.lower() == 'copper' else resistance_al
 
-def get_gauge_options(material):
-    amp_table = get_ampacity_table(material)
+def _build_gauge_options(amp_table):
     ints = [g for g in amp_table if isinstance(g, int)]
     kcmils = [g for g in amp_table if isinstance(g, str)]
     sorted_ints = sorted(ints, reverse=True)          # 14 → 1
     sorted_kcmils = sorted(kcmils)                    # '1/0' → '4/0'
     return sorted_ints + sorted_kcmils                # smallest wire → largest
 
+# Gauge ordering is fixed per material, so build it once at import. Stored as tuples
+# so callers can't reorder the shared sequence out of step with the lookup tables below.
+_GAUGE_OPTIONS = {
+    'copper': tuple(_build_gauge_options(ampacity_cu)),
+    'aluminum': tuple(_build_gauge_options(ampacity_al)),
+}
+
+_GAUGE_INDEX = {mat: {awg: i for i, awg in enumerate(opts)} for mat, opts in _GAUGE_OPTIONS.items()}
+
+_GAUGE_AWGS = {mat: np.array(opts, dtype=object) for mat, opts in _GAUGE_OPTIONS.items()}
+
+_RES_COL = 3
+
+def _build_gauge_data(options, amp_table, res_table):
+    # One 32-byte row per gauge in option order: amp@60, amp@75, amp@90, resistance.
+    # float64 so resistance (and hence voltage drop) matches the dict tables exactly.
+    data = np.empty((len(options), 4), dtype=np.float64)
+    for i, awg in enumerate(options):
+        data[i, :_RES_COL] = amp_table[awg]
+        data[i, _RES_COL] = res_table[awg]
+    return data
+
+_GAUGE_DATA = {
+    'copper': _build_gauge_data(_GAUGE_OPTIONS['copper'], ampacity_cu, resistance_cu),
+    'aluminum': _build_gauge_data(_GAUGE_OPTIONS['aluminum'], ampacity_al, resistance_al),
+}
+
+def _material_key(material):
+    return 'copper' if material.lower() == 'copper' else 'aluminum'
+
+def get_gauge_options(material):
+    return _GAUGE_OPTIONS[_material_key(material)]
+
+def get_gauge_index(material):
+    return _GAUGE_INDEX[_material_key(material)]
+
 def find_min_gauge(required_ampacity, temp_idx, material):
-    options = get_gauge_options(material)
-    amp_table = get_ampacity_table(material)
-    for awg in options:
-        amps = amp_table[awg][temp_idx]
-        if amps >= required_ampacity:
-            return awg, amps
-    return None, None
+    mat = _material_key(material)
+    amps = _GAUGE_DATA[mat][:, temp_idx]
+    i = int(np.searchsorted(amps, required_ampacity, side='left'))
+    if i == len(amps):
+        return None, None
+    return _GAUGE_OPTIONS[mat][i], int(amps[i])
+
+def find_min_gauge_batch(required_ampacities, temp_idx, material):
+    # Vectorized find_min_gauge over an array of required ampacities (e.g. a current sweep).
+    # Returns arrays shaped like the input; gauges are None and ampacities NaN where nothing fits.
+    mat = _material_key(material)
+    amps = _GAUGE_DATA[mat][:, temp_idx]
+    idx = np.searchsorted(amps, np.asarray(required_ampacities), side='left')
+    fits = idx < len(amps)
+    safe_idx = np.minimum(idx, len(amps) - 1)
+    awgs = np.where(fits, _GAUGE_AWGS[mat][safe_idx], None)
+    allowed = np.where(fits, amps[safe_idx], np.nan)
+    return awgs, allowed
+
+def voltage_drop_all(current, length_ft, voltage, material, start_idx=0):
+    # Voltage drop for every gauge from start_idx up, in gauge order; current/length may be arrays
+    r = _GAUGE_DATA[_material_key(material)][start_idx:, _RES_COL]
+    vd_volts = 2 * np.multiply.outer(np.asarray(current) * length_ft, r) / 1000  # single-phase
+    vd_percent = (vd_volts / voltage) * 100 if voltage != 0 else np.zeros_like(vd_volts)
+    return vd_volts, vd_percent
 
 def voltage_drop(current, length_ft, awg, voltage, material):
-    res_table = get_resistance_table(material)
-    if awg not in res_table:
+    mat = _material_key(material)
+    idx = _GAUGE_INDEX[mat].get(awg)
+    if idx is None:
         return None, None
-    r = res_table[awg]
+    r = float(_GAUGE_DATA[mat][idx, _RES_COL])
     vd_volts = 2 * current * length_ft * r / 1000  # single-phase
     vd_percent = (vd_volts / voltage) * 100 if voltage != 0 else 0
     return vd_volts, vd_percent
@@ -104,13 +162,26 @@ def voltage_drop(current, length_ft, awg, voltage, material):
 # Safe input helpers
 # ────────────────────────────────────────────────
 
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+_COPPER_ALIASES = frozenset({'c', 'cu', 'copper'})
+_ALUMINUM_ALIASES = frozenset({'a', 'al', 'aluminum'})
+
+@lru_cache(maxsize=64)
+def _parse_float(raw):
+    return float(raw)
+
+@lru_cache(maxsize=64)
+def _parse_int(raw):
+    return int(raw)
+
 def safe_float(prompt, default=None):
     while True:
         raw = input(prompt).strip()
         if raw == "" and default is not None:
             return default
         try:
-            return float(raw)
+            return _parse_float(raw)
         except ValueError:
             print(f"Invalid number: '{raw}' — please try again.")
 
@@ -120,7 +191,7 @@ def safe_int(prompt, valid_options=None, default=None):
         if raw == "" and default is not None:
             return default
         try:
-            val = int(raw)
+            val = _parse_int(raw)
             if valid_options and val not in valid_options:
                 print(f"Please enter one of: {valid_options}")
                 continue
@@ -133,9 +204,9 @@ def safe_yes_no(prompt, default='n'):
         raw = input(prompt).strip().lower()
         if raw == "":
             return default == 'y'
-        if raw in ['y', 'yes']:
+        if raw in _YES:
             return True
-        if raw in ['n', 'no']:
+        if raw in _NO:
             return False
         print("Please enter y/yes or n/no.")
 
@@ -148,7 +219,7 @@ def main():
     print("Enter values below. Press Enter to use defaults where shown.\n")
 
     material_raw = input("Conductor material (copper or aluminum) [default copper]: ").strip().lower() or 'copper'
-    material = 'copper' if material_raw in ['c', 'cu', 'copper'] else 'aluminum' if material_raw in ['a', 'al', 'aluminum'] else 'copper'
+    material = 'copper' if material_raw in _COPPER_ALIASES else 'aluminum' if material_raw in _ALUMINUM_ALIASES else 'copper'
     print(f"Using {material.capitalize()}.\n")
 
     current  = safe_float("Load current (A): ")
@@ -177,38 +248,33 @@ def main():
 
     print(f"Actual load current used for voltage drop calculation: {current:.1f} A")
 
-    vd_volts, vd_percent = voltage_drop(current, length, awg, voltage, material)
-    if vd_volts is not None:
-        print(f"Calculated voltage drop: {vd_volts:.2f} V  ({vd_percent:.2f}%)")
-
-        current_awg = awg
-        while vd_percent > vd_max:
-            print(f"  → Exceeds {vd_max}% limit! Trying larger wire...")
-            options = get_gauge_options(material)
-            try:
-                idx = options.index(current_awg)
-                if idx == len(options) - 1:
-                    print("  Cannot improve further — largest wire in table still exceeds limit.")
-                    break
-                current_awg = options[idx + 1]
-            except ValueError:
-                print("Gauge not found in list — stopping.")
-                break
-
-            vd_volts, vd_percent = voltage_drop(current, length, current_awg, voltage, material)
-            if vd_volts is not None:
-                print(f"  {current_awg} AWG → drop {vd_percent:.2f}% ({vd_volts:.2f} V)")
-
-        if vd_percent <= vd_max:
-            print(f"\nFinal recommendation: {current_awg} AWG (meets both ampacity and voltage drop limit)")
-        else:
-            print("\nEven the largest wire exceeds voltage drop limit — consider:")
-            print("  • Shorten the run length")
-            print("  • Reduce the load current")
-            print("  • Use parallel conductors")
-            print("  • Increase allowable drop (if code permits)")
+    options = get_gauge_options(material)
+    i0 = get_gauge_index(material)[awg]
+
+    # Drop for the minimum gauge and every larger one. Upsizing stops at the first gauge
+    # not over the limit, written as ~(>) so a NaN drop stops immediately, as it always has.
+    with np.errstate(invalid='ignore'):
+        vd_volts, vd_percent = voltage_drop_all(current, length, voltage, material, start_idx=i0)
+    print(f"Calculated voltage drop: {vd_volts[0]:.2f} V  ({vd_percent[0]:.2f}%)")
+
+    exceeds = vd_percent > vd_max
+    last = len(vd_percent) - 1 if exceeds.all() else int((~exceeds).argmax())
+    for step in range(1, last + 1):
+        print(f"  → Exceeds {vd_max}% limit! Trying larger wire...")
+        print(f"  {options[i0 + step]} AWG → drop {vd_percent[step]:.2f}% ({vd_volts[step]:.2f} V)")
+
+    if exceeds.all():
+        print(f"  → Exceeds {vd_max}% limit! Trying larger wire...")
+        print("  Cannot improve further — largest wire in table still exceeds limit.")
+
+    if vd_percent[last] <= vd_max:
+        print(f"\nFinal recommendation: {options[i0 + last]} AWG (meets both ampacity and voltage drop limit)")
     else:
-        print("Resistance data not available for selected gauge.")
+        print("\nEven the largest wire exceeds voltage drop limit — consider:")
+        print("  • Shorten the run length")
+        print("  • Reduce the load current")
+        print("  • Use parallel conductors")
+        print("  • Increase allowable drop (if code permits)")
 
     print("\nNotes & Disclaimers:")
     print("- Uses NEC 2023 Table 310.15(B)(16) ampacities and Ch.9 Table 8 resistances (approximate)")